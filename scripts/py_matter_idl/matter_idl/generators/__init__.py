@@ -169,8 +169,24 @@ class CodeGenerator:
             return
 
         logging.info(f"Template path: {template_path}, CWD: {os.getcwd()}")
-        rendered = self.jinja_env.get_template(template_path).render(vars)
+        self._store_rendered_output(output_file_name, self.jinja_env.get_template(template_path).render(vars))
 
+    def internal_render_template_output(self, template: Optional[jinja2.Template], output_file_name: str, vars: Dict):
+        """
+        Same as `internal_render_one_output` except that it uses an already
+        loaded template.
+
+        Meant for generators that render the same template for many outputs
+        (e.g. once per cluster), so that the template lookup is done only once.
+        The template is not used for dry runs and may be None in that case.
+        """
+        logging.info("File to be generated: %s" % output_file_name)
+        if self.dry_run:
+            return
+
+        self._store_rendered_output(output_file_name, template.render(vars))
+
+    def _store_rendered_output(self, output_file_name: str, rendered: str):
         # Report regardless if it has changed or not. This is because even if
         # files are unchanged, validation of what the correct output is should
         # still be done.
@@ -14,27 +14,32 @@
 # limitations under the License.
 
 import dataclasses
-import enum
 import logging
 import os
-from typing import List, Optional, Set
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from matter_idl.generators import CodeGenerator, GeneratorStorage
 from matter_idl.generators.type_definitions import (BasicInteger, BasicString, FundamentalType, IdlBitmapType, IdlEnumType, IdlType,
                                                     ParseDataType, TypeLookupContext)
 from matter_idl.matter_idl_types import (Attribute, Cluster, Command, DataType, Field, FieldQuality, Idl, Struct, StructQuality,
                                          StructTag)
-from stringcase import capitalcase
 
 
-@dataclasses.dataclass
+# NOTE: __slots__ are declared explicitly as dataclass(slots=True)
+#       requires python 3.10
+@dataclasses.dataclass(frozen=True)
 class GenerateTarget:
+    __slots__ = ('template', 'output_name')
+
     template: str
     output_name: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class GlobalType:
+    __slots__ = ('name', 'cpp_type', 'idl_type')
+
     name: str      # java name
     cpp_type: str  # underlying type
     idl_type: str  # assumed IDL type
@@ -58,8 +63,80 @@ _GLOBAL_TYPES = [
 ]
 
 
+_ParsedType = Union[BasicInteger, BasicString, FundamentalType, IdlType, IdlEnumType, IdlBitmapType]
+
+
+class _IdentityMemo:
+    """
+    Remembers results of a function, keyed by the identity of its arguments.
+
+    Entries keep a reference to their arguments, so that argument ids cannot
+    be reused while the memo is alive.
+    """
+
+    def __init__(self, function: Callable):
+        self._function = function
+        self._entries: Dict[Tuple[int, ...], Tuple[Tuple, Any]] = {}
+
+    def __call__(self, *args):
+        key = tuple(map(id, args))
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = (args, self._function(*args))
+            self._entries[key] = entry
+        return entry[1]
+
+
+class _KotlinLookupContext(TypeLookupContext):
+    """
+    A lookup context that remembers type lookups.
+
+    Templates resolve the types of the same fields many times, results are
+    cached for the lifetime of the context.
+    """
+
+    def __init__(self, idl: Idl, cluster: Optional[Cluster]):
+        super().__init__(idl, cluster)
+
+        # Type kinds only depend on the type name
+        self.is_enum_type = lru_cache(maxsize=None)(self.is_enum_type)
+        self.is_struct_type = lru_cache(maxsize=None)(self.is_struct_type)
+        self.is_bitmap_type = lru_cache(maxsize=None)(self.is_bitmap_type)
+
+        self._parsed_types: Dict[Tuple[str, Optional[int]], _ParsedType] = {}
+        self.field_global_name = _IdentityMemo(partial(_FieldToGlobalName, context=self))
+
+    def parse_data_type(self, data_type: DataType) -> _ParsedType:
+        """ParseDataType, remembering results by type name (and length)."""
+        key = (data_type.name, data_type.max_length)
+        parsed = self._parsed_types.get(key)
+        if parsed is None:
+            parsed = ParseDataType(data_type, self)
+            self._parsed_types[key] = parsed
+        return parsed
+
+
+def _ParseDataTypeCached(data_type: DataType, context: TypeLookupContext) -> _ParsedType:
+    """
+    Same as ParseDataType, however uses the cache of the lookup context
+    if it has one.
+
+    Basic types are parsed without any lookups, which is faster than a
+    cache lookup.
+    """
+    if data_type.name not in _BASIC_TYPE_NAMES and isinstance(context, _KotlinLookupContext):
+        return context.parse_data_type(data_type)
+    return ParseDataType(data_type, context)
+
+
+# Global names of integers, keyed by (power_of_two_bits, is_signed)
+_INTEGER_GLOBAL_NAMES = {
+    (bits, is_signed): f"Int{bits}{'s' if is_signed else 'u'}" for bits in (8, 16, 32, 64) for is_signed in (True, False)
+}
+
+
 def _UnderlyingType(field: Field, context: TypeLookupContext) -> Optional[str]:
-    actual = ParseDataType(field.data_type, context)
+    actual = _ParseDataTypeCached(field.data_type, context)
     if isinstance(actual, (IdlEnumType, IdlBitmapType)):
         actual = actual.base_type
 
@@ -69,10 +146,10 @@ def _UnderlyingType(field: Field, context: TypeLookupContext) -> Optional[str]:
         else:
             return 'String'
     elif isinstance(actual, BasicInteger):
-        if actual.is_signed:
-            return "Int{}s".format(actual.power_of_two_bits)
-        else:
-            return "Int{}u".format(actual.power_of_two_bits)
+        name = _INTEGER_GLOBAL_NAMES.get((actual.power_of_two_bits, actual.is_signed))
+        if name is None:
+            name = f"Int{actual.power_of_two_bits}{'s' if actual.is_signed else 'u'}"
+        return name
     elif isinstance(actual, FundamentalType):
         if actual == FundamentalType.BOOL:
             return 'Boolean'
@@ -81,7 +158,7 @@ def _UnderlyingType(field: Field, context: TypeLookupContext) -> Optional[str]:
         elif actual == FundamentalType.DOUBLE:
             return 'Double'
         else:
-            logging.warn('Unknown fundamental type: %r' % actual)
+            logging.warning('Unknown fundamental type: %r', actual)
 
     return None
 
@@ -89,7 +166,16 @@ def _UnderlyingType(field: Field, context: TypeLookupContext) -> Optional[str]:
 def FieldToGlobalName(field: Field, context: TypeLookupContext) -> Optional[str]:
     """Global names are used for generic callbacks shared across
     all clusters (e.g. for bool/float/uint32 and similar)
+
+    Several callback name filters query this for the same attribute, so
+    results are cached in the lookup context when possible.
     """
+    if isinstance(context, _KotlinLookupContext):
+        return context.field_global_name(field)
+    return _FieldToGlobalName(field, context)
+
+
+def _FieldToGlobalName(field: Field, context: TypeLookupContext) -> Optional[str]:
     if field.is_list:
         return None  # lists are always specific per cluster
 
@@ -128,27 +214,27 @@ _KNOWN_DECODABLE_TYPES = {
 }
 
 
+# Global names that have a different kotlin name. All others
+# (Double/Float/Boolean/CharString/OctetString) are used as-is.
+_GLOBAL_NAME_TO_JAVA_NAME = {
+    'Int8s': 'Byte',
+    'Int8u': 'UByte',
+    'Int16s': 'Short',
+    'Int16u': 'UShort',
+    'Int32s': 'Int',
+    'Int32u': 'UInt',
+    'Int64s': 'Long',
+    'Int64u': 'ULong',
+}
+
+
 def GlobalNameToJavaName(name: str) -> str:
-    if name == 'Int8s':
-        return 'Byte'
-    if name == 'Int8u':
-        return 'UByte'
-    if name == 'Int16s':
-        return 'Short'
-    if name == 'Int16u':
-        return 'UShort'
-
-    if name == 'Int32s':
-        return 'Int'
-    if name == 'Int32u':
-        return 'UInt'
-    if name == 'Int64s':
-        return 'Long'
-    if name == 'Int64u':
-        return 'ULong'
-
-    # Double/Float/Boolean/CharString/OctetString
-    return name
+    return _GLOBAL_NAME_TO_JAVA_NAME.get(name, name)
+
+
+def _CapitalCase(name: str) -> str:
+    """Uppercases the first letter of a name (same as stringcase.capitalcase)."""
+    return name[:1].upper() + name[1:]
 
 
 def DelegatedCallbackName(attr: Attribute, context: TypeLookupContext) -> str:
@@ -160,7 +246,7 @@ def DelegatedCallbackName(attr: Attribute, context: TypeLookupContext) -> str:
     if global_name:
         return 'Delegated{}AttributeCallback'.format(GlobalNameToJavaName(global_name))
 
-    return 'Delegated{}Cluster{}AttributeCallback'.format(context.cluster.name, capitalcase(attr.definition.name))
+    return 'Delegated{}Cluster{}AttributeCallback'.format(context.cluster.name, _CapitalCase(attr.definition.name))
 
 
 def ChipClustersCallbackName(attr: Attribute, context: TypeLookupContext) -> str:
@@ -173,7 +259,7 @@ def ChipClustersCallbackName(attr: Attribute, context: TypeLookupContext) -> str
     if global_name:
         return 'ChipClusters.{}AttributeCallback'.format(GlobalNameToJavaName(global_name))
 
-    return 'ChipClusters.{}Cluster.{}AttributeCallback'.format(context.cluster.name, capitalcase(attr.definition.name))
+    return 'ChipClusters.{}Cluster.{}AttributeCallback'.format(context.cluster.name, _CapitalCase(attr.definition.name))
 
 
 def CallbackName(attr: Attribute, context: TypeLookupContext) -> str:
@@ -189,28 +275,38 @@ def CallbackName(attr: Attribute, context: TypeLookupContext) -> str:
     global_name = FieldToGlobalName(attr.definition, context)
 
     if global_name:
-        return 'CHIP{}AttributeCallback'.format(capitalcase(global_name))
+        return 'CHIP{}AttributeCallback'.format(_CapitalCase(global_name))
 
     return 'CHIP{}{}AttributeCallback'.format(
-        capitalcase(context.cluster.name),
-        capitalcase(attr.definition.name)
+        _CapitalCase(context.cluster.name),
+        _CapitalCase(attr.definition.name)
     )
 
 
+def _IsDefaultSuccessCommand(command: Command) -> bool:
+    """Returns true if the command responds with a default (status) response."""
+    name = command.output_param
+    if name == 'DefaultSuccess':
+        return True
+
+    # Case-insensitive compare, only lowercasing names of the right length
+    return len(name) == len('DefaultSuccess') and name.lower() == 'defaultsuccess'
+
+
 def CommandCallbackName(command: Command, cluster: Cluster):
-    if command.output_param.lower() == 'defaultsuccess':
+    if _IsDefaultSuccessCommand(command):
         return 'DefaultSuccess'
     return '{}Cluster{}'.format(cluster.name, command.output_param)
 
 
 def JavaCommandCallbackName(command: Command):
-    if command.output_param.lower() == 'defaultsuccess':
+    if _IsDefaultSuccessCommand(command):
         return 'DefaultCluster'
     return '{}'.format(command.output_param)
 
 
 def IsCommandNotDefaultCallback(command: Command) -> bool:
-    return command.output_param.lower() != 'defaultsuccess'
+    return not _IsDefaultSuccessCommand(command)
 
 
 def JavaAttributeCallbackName(attr: Attribute, context: TypeLookupContext) -> str:
@@ -223,7 +319,7 @@ def JavaAttributeCallbackName(attr: Attribute, context: TypeLookupContext) -> st
     if global_name:
         return '{}'.format(GlobalNameToJavaName(global_name))
 
-    return '{}Attribute'.format(capitalcase(attr.definition.name))
+    return '{}Attribute'.format(_CapitalCase(attr.definition.name))
 
 
 def IsFieldGlobalName(field: Field, context: TypeLookupContext) -> bool:
@@ -239,13 +335,62 @@ def attributesWithSupportedCallback(attrs, context: TypeLookupContext):
         # Attributes will be generated for all types
         # except non-list structures
         if not attr.definition.is_list:
-            underlying = ParseDataType(attr.definition.data_type, context)
+            if attr.definition.data_type.name in _BASIC_TYPE_NAMES:
+                yield attr
+                continue
+
+            underlying = _ParseDataTypeCached(attr.definition.data_type, context)
             if isinstance(underlying, IdlType):
                 continue
 
         yield attr
 
 
+# Lowercase names of string data types
+_OCTET_STRING_TYPES = frozenset({'octet_string', 'long_octet_string'})
+_CHAR_STRING_TYPES = frozenset({'char_string', 'long_char_string'})
+
+# Data types that can use one of the global callbacks
+_GLOBAL_CALLBACK_TYPES = frozenset({
+    "boolean",
+    "single",
+    "double",
+    "int8s",
+    "int8u",
+    "int16s",
+    "int16u",
+    "int24s",
+    "int24u",
+    "int32s",
+    "int32u",
+    "int40s",
+    "int40u",
+    "int48s",
+    "int48u",
+    "int56s",
+    "int56u",
+    "int64s",
+    "int64u",
+    "enum8",
+    "enum16",
+    "enum32",
+    "enum64",
+    "bitmap8",
+    "bitmap16",
+    "bitmap32",
+    "bitmap64",
+    "char_string",
+    "long_char_string",
+    "octet_string",
+    "long_octet_string",
+})
+
+# Data types that ParseDataType resolves to a basic (i.e. not IdlType) type
+# without any lookups. enum32/enum64 are not known sized types and get
+# parsed as generic IDL types, so they are excluded.
+_BASIC_TYPE_NAMES = _GLOBAL_CALLBACK_TYPES - {"enum32", "enum64"}
+
+
 def _IsUsingGlobalCallback(field: Field, context: TypeLookupContext):
     """Test to determine if the data type of a field can use one of
     the global callbacks (i.e. it is a basic double/integer/bool etc.)
@@ -256,54 +401,25 @@ def _IsUsingGlobalCallback(field: Field, context: TypeLookupContext):
     if field.is_nullable:
         return False
 
-    return field.data_type.name in {
-        "boolean",
-        "single",
-        "double",
-        "int8s",
-        "int8u",
-        "int16s",
-        "int16u",
-        "int24s",
-        "int24u",
-        "int32s",
-        "int32u",
-        "int40s",
-        "int40u",
-        "int48s",
-        "int48u",
-        "int56s",
-        "int56u",
-        "int64s",
-        "int64u",
-        "enum8",
-        "enum16",
-        "enum32",
-        "enum64",
-        "bitmap8",
-        "bitmap16",
-        "bitmap32",
-        "bitmap64",
-        "char_string",
-        "long_char_string",
-        "octet_string",
-        "long_octet_string",
-    }
-
-
-def NamedFilter(choices: List, name: str):
+    return field.data_type.name in _GLOBAL_CALLBACK_TYPES
+
+
+def _NameIndex(choices: List) -> Dict[str, Any]:
+    """Maps names to items. The first item wins on duplicate names."""
+    index = {}
     for choice in choices:
-        if choice.name == name:
-            return choice
-    raise Exception("No item named %s in %r" % (name, choices))
+        index.setdefault(choice.name, choice)
+    return index
 
 
 def ToBoxedJavaType(field: Field):
     if field.is_optional:
         return 'jobject'
-    elif field.data_type.name.lower() in ['octet_string', 'long_octet_string']:
+
+    name = field.data_type.name.lower()
+    if name in _OCTET_STRING_TYPES:
         return 'jbyteArray'
-    elif field.data_type.name.lower() in ['char_string', 'long_char_string']:
+    elif name in _CHAR_STRING_TYPES:
         return 'jstring'
     else:
         return 'jobject'
@@ -317,18 +433,54 @@ def LowercaseFirst(name: str) -> str:
     Can be used for variable naming, eg insider structures, codegen will
     call things "Foo foo" (notice variable name is lowercase).
     """
-    if len(name) > 1 and name[1].lower() != name[1]:
+    # IDL identifiers are ASCII, so a range check is enough to detect uppercase
+    if len(name) > 1 and 'A' <= name[1] <= 'Z':
         # Odd workaround: PAKEVerifier should not become pAKEVerifier
         return name
     return name[0].lower() + name[1:]
 
 
-class EncodableValueAttr(enum.Enum):
-    LIST = enum.auto()
-    NULLABLE = enum.auto()
-    OPTIONAL = enum.auto()
+class EncodableValueAttr:
+    """
+    Bit flags that can be set in EncodableValue.attrs.
+
+    Plain integers rather than an enum as these are tested very often
+    during code generation.
+    """
+    LIST = 0x01
+    NULLABLE = 0x02
+    OPTIONAL = 0x04
+
+
+# JNI signatures of fundamental types as (unboxed, boxed)
+_FUNDAMENTAL_JAVA_SIGNATURES = {
+    FundamentalType.BOOL: ("Z", "Ljava/lang/Boolean;"),
+    FundamentalType.FLOAT: ("F", "Ljava/lang/Float;"),
+    FundamentalType.DOUBLE: ("D", "Ljava/lang/Double;"),
+}
+
 
+def _IntegerBoxedJavaSignature(t: Union[BasicInteger, IdlEnumType, IdlBitmapType]) -> str:
+    return "Ljava/lang/Long;" if t.byte_count >= 3 else "Ljava/lang/Integer;"
+
+
+# JNI signature builders, keyed by the exact class returned by ParseDataType
+_UNBOXED_JAVA_SIGNATURES = {
+    FundamentalType: lambda t: _FUNDAMENTAL_JAVA_SIGNATURES[t][0],
+    BasicInteger: lambda t: "J" if t.byte_count >= 3 else "I",
+}
 
+_BOXED_JAVA_SIGNATURES = {
+    FundamentalType: lambda t: _FUNDAMENTAL_JAVA_SIGNATURES[t][1],
+    BasicInteger: _IntegerBoxedJavaSignature,
+    BasicString: lambda t: "[B" if t.is_binary else "Ljava/lang/String;",
+    IdlEnumType: _IntegerBoxedJavaSignature,
+    IdlBitmapType: _IntegerBoxedJavaSignature,
+}
+
+
+# eq=False: values compare and hash by identity (DataType is not hashable)
+@dataclasses.dataclass(eq=False)
 class EncodableValue:
     """
     Contains helpers for encoding values, specifically lookups
@@ -340,12 +492,14 @@ class EncodableValue:
         can implement things like 'if x != null { treat non-null x}'
       - Java specific conversions: get boxed types and JNI string signautes
         for the underlying types.
+
+    Values are not modified once created: without_* methods return copies.
     """
+    __slots__ = ('context', 'data_type', 'attrs')
 
-    def __init__(self, context: TypeLookupContext, data_type: DataType, attrs: Set[EncodableValueAttr]):
-        self.context = context
-        self.data_type = data_type
-        self.attrs = attrs
+    context: TypeLookupContext
+    data_type: DataType
+    attrs: int  # bitwise OR of EncodableValueAttr flags
 
     @property
     def is_basic_type(self):
@@ -354,23 +508,23 @@ class EncodableValue:
 
     @property
     def is_nullable(self):
-        return EncodableValueAttr.NULLABLE in self.attrs
+        return (self.attrs & EncodableValueAttr.NULLABLE) != 0
 
     @property
     def is_optional(self):
-        return EncodableValueAttr.OPTIONAL in self.attrs
+        return (self.attrs & EncodableValueAttr.OPTIONAL) != 0
 
     @property
     def is_list(self):
-        return EncodableValueAttr.LIST in self.attrs
+        return (self.attrs & EncodableValueAttr.LIST) != 0
 
     @property
     def is_octet_string(self):
-        return self.data_type.name.lower() in ['octet_string', 'long_octet_string']
+        return self.data_type.name.lower() in _OCTET_STRING_TYPES
 
     @property
     def is_char_string(self):
-        return self.data_type.name.lower() in ['char_string', 'long_char_string']
+        return self.data_type.name.lower() in _CHAR_STRING_TYPES
 
     @property
     def is_struct(self):
@@ -392,19 +546,13 @@ class EncodableValue:
         return EncodableValue(self.context, self.data_type, self.attrs)
 
     def without_nullable(self):
-        result = self.clone()
-        result.attrs.remove(EncodableValueAttr.NULLABLE)
-        return result
+        return EncodableValue(self.context, self.data_type, self.attrs & ~EncodableValueAttr.NULLABLE)
 
     def without_optional(self):
-        result = self.clone()
-        result.attrs.remove(EncodableValueAttr.OPTIONAL)
-        return result
+        return EncodableValue(self.context, self.data_type, self.attrs & ~EncodableValueAttr.OPTIONAL)
 
     def without_list(self):
-        result = self.clone()
-        result.attrs.remove(EncodableValueAttr.LIST)
-        return result
+        return EncodableValue(self.context, self.data_type, self.attrs & ~EncodableValueAttr.LIST)
 
     def get_underlying_struct(self):
         s = self.context.find_struct(self.data_type.name)
@@ -420,7 +568,7 @@ class EncodableValue:
 
     @property
     def kotlin_type(self):
-        t = ParseDataType(self.data_type, self.context)
+        t = _ParseDataTypeCached(self.data_type, self.context)
 
         if isinstance(t, FundamentalType):
             if t == FundamentalType.BOOL:
@@ -479,24 +627,12 @@ class EncodableValue:
         if self.is_optional or self.is_list:
             raise Exception("Not a basic type: %r" % self)
 
-        t = ParseDataType(self.data_type, self.context)
+        t = _ParseDataTypeCached(self.data_type, self.context)
 
-        if isinstance(t, FundamentalType):
-            if t == FundamentalType.BOOL:
-                return "Z"
-            elif t == FundamentalType.FLOAT:
-                return "F"
-            elif t == FundamentalType.DOUBLE:
-                return "D"
-            else:
-                raise Exception("Unknown fundamental type")
-        elif isinstance(t, BasicInteger):
-            if t.byte_count >= 3:
-                return "J"
-            else:
-                return "I"
-        else:
+        signature = _UNBOXED_JAVA_SIGNATURES.get(type(t))
+        if signature is None:
             raise Exception("Not a basic type: %r" % self)
+        return signature(t)
 
     @property
     def boxed_java_signature(self):
@@ -507,46 +643,19 @@ class EncodableValue:
         if self.is_list:
             return "Ljava/util/ArrayList;"
 
-        t = ParseDataType(self.data_type, self.context)
+        t = _ParseDataTypeCached(self.data_type, self.context)
 
-        if isinstance(t, FundamentalType):
-            if t == FundamentalType.BOOL:
-                return "Ljava/lang/Boolean;"
-            elif t == FundamentalType.FLOAT:
-                return "Ljava/lang/Float;"
-            elif t == FundamentalType.DOUBLE:
-                return "Ljava/lang/Double;"
-            else:
-                raise Exception("Unknown fundamental type")
-        elif isinstance(t, BasicInteger):
-            if t.byte_count >= 3:
-                return "Ljava/lang/Long;"
-            else:
-                return "Ljava/lang/Integer;"
-        elif isinstance(t, BasicString):
-            if t.is_binary:
-                return "[B"
-            else:
-                return "Ljava/lang/String;"
-        elif isinstance(t, IdlEnumType):
-            if t.base_type.byte_count >= 3:
-                return "Ljava/lang/Long;"
-            else:
-                return "Ljava/lang/Integer;"
-        elif isinstance(t, IdlBitmapType):
-            if t.base_type.byte_count >= 3:
-                return "Ljava/lang/Long;"
-            else:
-                return "Ljava/lang/Integer;"
-        else:
+        signature = _BOXED_JAVA_SIGNATURES.get(type(t))
+        if signature is None:
             return "Lchip/controller/ChipStructs${}Cluster{};".format(self.context.cluster.name, self.data_type.name)
+        return signature(t)
 
 
 def GlobalEncodableValueFrom(typeName: str, context: TypeLookupContext) -> EncodableValue:
     """
     Filter to convert a global type name to an encodable value
     """
-    return EncodableValue(context, DataType(name=typeName), set())
+    return EncodableValue(context, DataType(name=typeName), 0)
 
 
 def EncodableValueFrom(field: Field, context: TypeLookupContext) -> EncodableValue:
@@ -557,16 +666,16 @@ def EncodableValueFrom(field: Field, context: TypeLookupContext) -> EncodableVal
     a java-generator specific wrapper that can be manipulated and
     queried for properties like java native name or JNI string signature.
     """
-    attrs = set()
+    attrs = 0
 
     if field.is_optional:
-        attrs.add(EncodableValueAttr.OPTIONAL)
+        attrs |= EncodableValueAttr.OPTIONAL
 
     if field.is_nullable:
-        attrs.add(EncodableValueAttr.NULLABLE)
+        attrs |= EncodableValueAttr.NULLABLE
 
     if field.is_list:
-        attrs.add(EncodableValueAttr.LIST)
+        attrs |= EncodableValueAttr.LIST
 
     return EncodableValue(context, field.data_type, attrs)
 
@@ -578,8 +687,11 @@ def CreateLookupContext(idl: Idl, cluster: Optional[Cluster]) -> TypeLookupConte
     This is used to specify how structure/enum/other names are looked up.
     Generally one looks up within the specific cluster then if cluster does
     not contain a definition, we loop at global namespacing.
+
+    The returned context caches its type lookups. Kotlin generators reuse
+    one context per cluster for the duration of a render.
     """
-    return TypeLookupContext(idl, cluster)
+    return _KotlinLookupContext(idl, cluster)
 
 
 def CanGenerateSubscribe(attr: Attribute, lookup: TypeLookupContext) -> bool:
@@ -628,6 +740,12 @@ class __KotlinCodeGenerator(CodeGenerator):
         """
         super().__init__(storage, idl, fs_loader_searchpath=os.path.dirname(__file__))
 
+        # Templates do not change during generation, do not re-check them
+        # for changes on every load.
+        self.jinja_env.auto_reload = False
+
+        self._reset_render_caches()
+
         self.jinja_env.filters['attributesWithCallback'] = attributesWithSupportedCallback
         self.jinja_env.filters['callbackName'] = CallbackName
         self.jinja_env.filters['chipClustersCallbackName'] = ChipClustersCallbackName
@@ -636,12 +754,12 @@ class __KotlinCodeGenerator(CodeGenerator):
         self.jinja_env.filters['javaCommandCallbackName'] = JavaCommandCallbackName
         self.jinja_env.filters['isCommandNotDefaultCallback'] = IsCommandNotDefaultCallback
         self.jinja_env.filters['javaAttributeCallbackName'] = JavaAttributeCallbackName
-        self.jinja_env.filters['named'] = NamedFilter
+        self.jinja_env.filters['named'] = self._named
         self.jinja_env.filters['toBoxedJavaType'] = ToBoxedJavaType
         self.jinja_env.filters['lowercaseFirst'] = LowercaseFirst
         self.jinja_env.filters['asEncodable'] = EncodableValueFrom
         self.jinja_env.filters['globalAsEncodable'] = GlobalEncodableValueFrom
-        self.jinja_env.filters['createLookupContext'] = CreateLookupContext
+        self.jinja_env.filters['createLookupContext'] = self._create_lookup_context
         self.jinja_env.filters['canGenerateSubscribe'] = CanGenerateSubscribe
         self.jinja_env.filters['isFabricScopedList'] = IsFabricScopedList
         self.jinja_env.filters['hasResponse'] = CommandHasResponse
@@ -650,6 +768,37 @@ class __KotlinCodeGenerator(CodeGenerator):
         self.jinja_env.tests['is_using_global_callback'] = _IsUsingGlobalCallback
         self.jinja_env.tests['is_field_global_name'] = IsFieldGlobalName
 
+    def render(self, dry_run=False):
+        try:
+            super().render(dry_run)
+        finally:
+            # Cached lookups are only valid (and only kept alive) for one render
+            self._reset_render_caches()
+
+    def _reset_render_caches(self):
+        self._lookup_contexts = _IdentityMemo(CreateLookupContext)
+        self._name_indexes = _IdentityMemo(_NameIndex)
+
+    def _create_lookup_context(self, idl: Idl, cluster: Optional[Cluster]) -> TypeLookupContext:
+        """
+        Returns the lookup context of the given cluster for the current render.
+
+        Using a single context per cluster allows all templates to share its
+        cached lookups.
+        """
+        return self._lookup_contexts(idl, cluster)
+
+    def _named(self, choices: List, name: str):
+        """
+        Returns the first item in choices with the given name.
+
+        Name indexes are built once per list for the current render.
+        """
+        choice = self._name_indexes(choices).get(name)
+        if choice is None:
+            raise Exception("No item named %s in %r" % (name, choices))
+        return choice
+
 
 class KotlinClassGenerator(__KotlinCodeGenerator):
     """Generates .kt files """
@@ -661,7 +810,6 @@ class KotlinClassGenerator(__KotlinCodeGenerator):
         """
         Renders .kt files required for kotlin matter support
         """
-
         clientClusters = self.idl.clusters
 
         self.internal_render_one_output(
@@ -673,11 +821,20 @@ class KotlinClassGenerator(__KotlinCodeGenerator):
             }
         )
 
+        # Templates below are rendered many times, only load them once.
+        # Dry runs do not render anything, so they do not need templates.
+        if self.dry_run:
+            clusters_template = structs_template = event_structs_template = None
+        else:
+            clusters_template = self.jinja_env.get_template("MatterClusters.jinja")
+            structs_template = self.jinja_env.get_template("MatterStructs.jinja")
+            event_structs_template = self.jinja_env.get_template("MatterEventStructs.jinja")
+
         # Generate a `.kt` file for each cluster.
         for cluster in clientClusters:
             output_name = f"java/matter/controller/cluster/clusters/{cluster.name}Cluster.kt"
-            self.internal_render_one_output(
-                template_path="MatterClusters.jinja",
+            self.internal_render_template_output(
+                template=clusters_template,
                 output_file_name=output_name,
                 vars={
                     'idl': self.idl,
@@ -693,15 +850,15 @@ class KotlinClassGenerator(__KotlinCodeGenerator):
                     continue
 
                 output_name = "java/matter/controller/cluster/structs/{cluster_name}Cluster{struct_name}.kt"
-                self.internal_render_one_output(
-                    template_path="MatterStructs.jinja",
+                self.internal_render_template_output(
+                    template=structs_template,
                     output_file_name=output_name.format(
                         cluster_name=cluster.name,
                         struct_name=struct.name),
                     vars={
                         'cluster': cluster,
                         'struct': struct,
-                        'typeLookup': TypeLookupContext(self.idl, cluster),
+                        'typeLookup': self._create_lookup_context(self.idl, cluster),
                     }
                 )
 
@@ -710,14 +867,14 @@ class KotlinClassGenerator(__KotlinCodeGenerator):
                     continue
 
                 output_name = "java/matter/controller/cluster/eventstructs/{cluster_name}Cluster{event_name}Event.kt"
-                self.internal_render_one_output(
-                    template_path="MatterEventStructs.jinja",
+                self.internal_render_template_output(
+                    template=event_structs_template,
                     output_file_name=output_name.format(
                         cluster_name=cluster.name,
                         event_name=event.name),
                     vars={
                         'cluster': cluster,
                         'event': event,
-                        'typeLookup': TypeLookupContext(self.idl, cluster),
+                        'typeLookup': self._create_lookup_context(self.idl, cluster),
                     }
                 )
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import sys
 from typing import Dict, Optional
 
 from lark import Lark
@@ -177,11 +178,15 @@ class MatterIdlTransformer(Transformer):
         return tokens[0].value
 
     def type(self, tokens):
-        """A type is just a string for the type
+        """A type is just a string for the type.
+
+        Type names are interned: the same few names are repeated across
+        the whole IDL and generators compare them against constant names
+        very often.
         """
         if len(tokens) != 1:
             raise Exception("Unexpected argument counts")
-        return tokens[0].value
+        return sys.intern(tokens[0].value)
 
     def data_type(self, tokens):
         if len(tokens) == 1:
@@ -34,6 +34,7 @@ from matter_idl.generators import GeneratorStorage
 from matter_idl.generators.cpp.application import CppApplicationGenerator
 from matter_idl.generators.cpp.tlvmeta import TLVMetaDataGenerator
 from matter_idl.generators.java import JavaClassGenerator, JavaJNIGenerator
+from matter_idl.generators.kotlin import KotlinClassGenerator
 from matter_idl.matter_idl_types import Idl
 
 TESTS_DIR = os.path.join(os.path.dirname(__file__), "tests")
@@ -120,6 +121,8 @@ class GeneratorTest:
             return JavaJNIGenerator(storage, idl)
         if self.generator_name.lower() == 'java-class':
             return JavaClassGenerator(storage, idl)
+        if self.generator_name.lower() == 'kotlin-class':
+            return KotlinClassGenerator(storage, idl)
         if self.generator_name.lower() == 'cpp-app':
             return CppApplicationGenerator(storage, idl)
         if self.generator_name.lower() == 'cpp-tlvmeta':
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+try:
+    from matter_idl.generators.kotlin import EncodableValueFrom
+except ImportError:
+    import sys
+
+    sys.path.append(os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..')))
+    from matter_idl.generators.kotlin import EncodableValueFrom
+
+from matter_idl.generators.type_definitions import TypeLookupContext
+from matter_idl.matter_idl_types import DataType, Field, FieldQuality, Idl
+
+
+class TestEncodableValue(unittest.TestCase):
+
+    def setUp(self):
+        self.lookup = TypeLookupContext(idl=Idl(), cluster=None)
+        self.field = Field(
+            data_type=DataType(name="int16u"),
+            code=1,
+            name="value",
+            is_list=True,
+            qualities=FieldQuality.NULLABLE | FieldQuality.OPTIONAL)
+
+    def testWithoutAttributesReturnsCopies(self):
+        value = EncodableValueFrom(self.field, self.lookup)
+
+        self.assertFalse(value.without_nullable().is_nullable)
+        self.assertFalse(value.without_optional().is_optional)
+        self.assertFalse(value.without_list().is_list)
+
+        # original value is unchanged
+        self.assertTrue(value.is_nullable)
+        self.assertTrue(value.is_optional)
+        self.assertTrue(value.is_list)
+
+    def testDerivedValuesKeepOtherAttributes(self):
+        value = EncodableValueFrom(self.field, self.lookup).without_nullable()
+
+        self.assertTrue(value.is_optional)
+        self.assertTrue(value.is_list)
+        self.assertEqual(value.boxed_java_signature, "Ljava/util/Optional;")
+        self.assertEqual(value.without_optional().boxed_java_signature, "Ljava/util/ArrayList;")
+        self.assertEqual(value.without_optional().without_list().boxed_java_signature, "Ljava/lang/Integer;")
+
+    def testHashable(self):
+        value = EncodableValueFrom(self.field, self.lookup)
+
+        self.assertEqual(hash(value), hash(value))
+        self.assertIn(value, {value})
+
+
+if __name__ == '__main__':
+    unittest.main()